@@ -2,11 +2,34 @@
 Module to interact with a Philips Hue Bridge.
 """
 
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
 from json import JSONEncoder, dumps, loads
 from enum import Enum
+from itertools import chain
+from pathlib import Path
 import logging
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 log = logging.getLogger('pyhue')
 
@@ -45,6 +68,122 @@ class LightEffect(Enum):
     COLOR_LOOP = 'colorloop'
 
 
+def _make_validator(key, expected_type, limits=None):
+    """_make_validator. Make the function checking the value of a keyword
+    argument.
+
+    :param key: Keyword argument key to check.
+    :param expected_type: Expected type of the value of keyword argument.
+    :param limits: Limits/boundaries the value of the keyword argument
+                   must be within, if None, the value has no limits,
+                   defaults to None.
+
+    :return: Function checking the value provided for the keyword argument,
+             raising TypeError in case it has an invalid type and ValueError
+             in case it has an invalid value. None is always accepted.
+    """
+    # Compare the exact type first, which is faster than isinstance() for the
+    # common case.
+    # pylint: disable=unidiomatic-typecheck
+    type_error = f'{key} must be a {expected_type.__name__}'
+
+    if limits is None:
+        def check_type(value):
+            if value is None or type(value) is expected_type:
+                return
+
+            if not isinstance(value, expected_type):
+                raise TypeError(type_error)
+
+        return check_type
+
+    minimum, maximum = limits
+    value_error = f'Value for {key} must be between {minimum} and {maximum}'
+
+    def check_type_and_limits(value):
+        if value is None:
+            return
+
+        if type(value) is not expected_type \
+                and not isinstance(value, expected_type):
+            raise TypeError(type_error)
+
+        if value < minimum or maximum < value:
+            raise ValueError(value_error)
+
+    return check_type_and_limits
+
+
+# Keyword arguments accepted to set the state of a light or a group of lights,
+# with their expected types and limits.
+_LIGHT_STATE_KWARGS = {
+    'on': (bool,),
+    'bri': (int, (1, 254)),
+    'bri_inc': (int, (-254, 254)),
+    'hue': (int, (0, 65535)),
+    'hue_inc': (int, (-65534, 65534)),
+    'sat': (int, (0, 65535)),
+    'sat_inc': (int, (-65534, 65534)),
+    'xy': (tuple, ((0, 0), (1.0, 1.0))),
+    'xy_inc': (tuple, ((-0.5, -0.5), (0.5, 0.5))),
+    'ct': (int, (153, 500)),
+    'ct_inc': (int, (-364, 635)),
+    'alert': (LightAlert,),
+    'effect': (LightEffect,),
+    'transitiontime': (int, (0, 65535)),
+}
+
+_LIGHT_STATE_VALIDATORS = {
+    key: _make_validator(key, *spec)
+    for key, spec in _LIGHT_STATE_KWARGS.items()
+}
+
+
+def _iter_prefix(obj, keys):
+    """_iter_prefix. Iterate over the values of a decoded JSON document
+    found at a prefix, like ijson.items() does.
+
+    :param obj: Decoded JSON document.
+    :param keys: Keys of the prefix, 'item' matches every element of a list.
+    :type keys: list
+
+    :return: Iterator over the values found at the prefix.
+    """
+    if not keys:
+        yield obj
+        return
+
+    key, *keys = keys
+
+    if key == 'item' and isinstance(obj, list):
+        for item in obj:
+            yield from _iter_prefix(item, keys)
+    elif isinstance(obj, dict) and key in obj:
+        yield from _iter_prefix(obj[key], keys)
+
+
+# Enumerations encoded into JSON as their value. Enumerations with members
+# cannot be subclassed, so comparing the exact class is enough.
+_ENUM_TYPES = frozenset((LightAlert, LightEffect))
+
+
+def _enum_default(o):
+    """_enum_default. Encode the objects JSON does not natively support.
+
+    :param o: Object to encode.
+
+    :raises TypeError: In case the object is not supported.
+
+    :return: Value of the LightAlert or LightEffect to encode.
+    """
+    if o.__class__ in _ENUM_TYPES:
+        # pylint: disable=protected-access
+        return o._value_
+    raise TypeError(
+        f'Object of type {o.__class__.__name__} is not JSON serializable'
+    )
+
+
 class MyJsonEncoder(JSONEncoder):
     """ MyJsonEncoder. Custom JSONEncoder to have a builtin support of
     LightAlert and LightEffect classes into JSON.
@@ -54,144 +193,327 @@ class MyJsonEncoder(JSONEncoder):
 
         :param o: Object to encode.
         """
-        if isinstance(o, (LightAlert, LightEffect)):
-            return o.value
-        return super().default(o)
+        return _enum_default(o)
 
 
-class HueBridge():
-    """HueBridge."""
+if orjson is not None:
+    def _dumps(obj):
+        """_dumps. Encode an object into UTF-8 JSON using orjson.
 
-    DEFAULT_CONF_PATH = os.path.expanduser(
-        os.path.join('~', '.config', 'pyhue', 'hue_bridge_config.json')
-    )
+        orjson natively encodes enumerations as their value, no Python
+        callback is needed for LightAlert and LightEffect.
 
-    @staticmethod
-    def __check_kwarg(kwargs, kwargs_key, expected_type, limits=None):
-        """check_argument.
+        :param obj: Object to encode.
 
-        :param kwargs: Provided keyword arguments.
-        :param kwargs_key: Keyword argument key to check.
-        :param expected_type: Expected type of the value of keyword argument.
-        :param limits: Limits/boundaries the value of the keyword argument
-                       must be within, if None, the value has no limits,
-                       defaults to None.
+        :return: JSON encoded object.
+        :rtype: bytes
+        """
+        return orjson.dumps(obj)
 
-        :raises ValueError: In case a provided keyword argument has invalid
-                            value.
-        :raises TypeError: In case a provided keyword argument has invalid
-                           type.
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        """_dumps. Encode an object into UTF-8 JSON.
+
+        :param obj: Object to encode.
+
+        :return: JSON encoded object.
+        :rtype: bytes
         """
-        value = kwargs.get(kwargs_key)
+        return dumps(obj, cls=MyJsonEncoder).encode()
 
-        if value is None:
-            return
+    _loads = loads
 
-        if not isinstance(value, expected_type):
-            raise TypeError(
-                f'{kwargs_key} must be a {expected_type.__name__}'
-            )
+# Encoded body of the requests, other than GET requests, without data.
+_EMPTY_BODY = _dumps({})
 
-        if limits is not None:
-            minimum, maximum = limits
-            if value < minimum or maximum < value:
-                raise ValueError(
-                    f'Value for {kwargs_key} must be between {minimum} and '
-                    f'{maximum}'
-                )
 
-    @staticmethod
-    def __parse_response(response):
-        """__parse_response. Parse a response from a Hue bridge.
+def _encode_request(request_type, url, data):
+    """_encode_request. Encode the body of a request to the Hue bridge.
 
-        :param response: Response content from the Hue bridge to parse.
-        """
-        if not response.ok:
-            raise HueError('Error sending the request')
+    The Hue bridge ignores the body of GET requests, none is sent when there
+    is no data.
 
-        response = response.json()
+    :param request_type: Type of request to perform (e.i. 'POST', 'PUT',
+                         'DELETE'...).
+    :type request_type: str
+    :param url: URL of the API to access, for logging.
+    :type url: str
+    :param data: Data to send.
+    :type data: dict
 
-        if isinstance(response, list):
-            for dict_ in response:
-                for key, value in dict_.items():
-                    if key == 'error':
-                        raise HueError(dumps(value, indent=4))
+    :return: Encoded body of the request, None if there is none.
+    :rtype: bytes
+    """
+    if data:
+        body = _dumps(data)
+    elif request_type == 'GET':
+        body = None
+    else:
+        body = _EMPTY_BODY
 
-                    if key == 'success':
-                        return value
+    if log.isEnabledFor(logging.DEBUG):
+        if body is None:
+            log.debug('%s request to %s', request_type, url)
+        else:
+            log.debug('%s request to %s with data:\n%s',
+                      request_type, url, body.decode())
 
-        elif isinstance(response, dict):
-            return response
+    return body
 
-        raise HueError('Unexpected response content')
 
-    # pylint: disable=too-many-arguments
-    @classmethod
-    def __do_request(cls, request_type, method, host, path, data):
-        """__do_request. Send a request to the Hue bridge.
+def _check_light_state_kwargs(kwargs):
+    """_check_light_state_kwargs. Check the keyword arguments provided to set
+    the state of a light or a group of lights.
 
-        :param request_type: Type of request to perform (e.i. 'POST', 'PUT',
-                             'DELETE'...).
-        :type request_type: str
-        :param method: Request method from the request module. Must match the
-                       request_type provided (e.i. requests.post, requests.put,
-                       requests.delete...).
-        :type method: function
-        :param host: Host name / IP address the Hue bridge is accessible at.
-        :type host: str
-        :param path: Path of the API to access.
-        :type path: str
-        :param data: Data to send.
-        :type data: dict
+    :param kwargs: Provided keyword arguments.
 
-        :raises HueError: In case of error.
+    :raises KeyError: In case a provided keyword argument has invalid key.
+    :raises ValueError: In case a provided keyword argument has invalid
+                        value.
+    :raises TypeError: In case a provided keyword argument has invalid type.
+    """
+    for key, value in kwargs.items():
+        validator = _LIGHT_STATE_VALIDATORS.get(key)
+        if validator is None:
+            raise KeyError(f'Unknown {key} keyword argument')
+        validator(value)
 
-        :return: Dictionary containing the response from the Hue Bridge.
-        :rtype: dict
-        """
-        url = f'http://{host}/{path}'
 
-        data = dumps(data, cls=MyJsonEncoder)
+def _read_content(response):
+    """_read_content. Read the whole content of a streamed response.
 
-        log.debug('%s request to %s with data:', request_type, url)
-        log.debug('%s', data)
+    The content is read from the underlying urllib3 response at once, instead
+    of being joined from chunks by requests, then the connection is returned
+    to the pool.
 
-        response = method(url, data=data)
+    :param response: Response to read, sent with stream=True.
+    :type response: requests.Response
 
-        log.debug('Response:')
-        log.debug(dumps(response.json(), indent=4, sort_keys=True))
+    :raises requests.ConnectionError: In case the content could not be read.
 
-        return cls.__parse_response(response)
+    :return: Content of the response.
+    :rtype: bytes
+    """
+    try:
+        return response.raw.read(decode_content=True)
+    except urllib3.exceptions.HTTPError as error:
+        raise requests.ConnectionError(error) from error
+    finally:
+        response.raw.release_conn()
+
+
+def _read_response(ok, content):
+    """_read_response. Check the status of a response from a Hue bridge and
+    decode its JSON content.
+
+    :param ok: Whether the status of the response reports a success.
+    :type ok: bool
+    :param content: Raw content of the response.
+    :type content: bytes
+
+    :raises HueError: In case the request failed.
+
+    :return: Decoded JSON content of the response.
+    """
+    if not ok:
+        raise HueError('Error sending the request')
+
+    body = _loads(content)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug('Response:\n%s', dumps(body, indent=4, sort_keys=True))
+
+    return body
+
+
+def _parse_response(response):
+    """_parse_response. Parse a response from a Hue bridge.
+
+    :param response: Decoded JSON content of the response from the Hue bridge
+                     to parse.
+
+    :raises HueError: In case the response reports an error.
+    """
+    if isinstance(response, list):
+        # Most responses hold a single result, handle it without iterating.
+        if len(response) == 1:
+            result = response[0]
+
+            if (value := result.get('error')) is not None:
+                raise HueError(dumps(value, indent=4))
+
+            if (value := result.get('success')) is not None:
+                return value
+
+        for dict_ in response:
+            for key, value in dict_.items():
+                if key == 'error':
+                    raise HueError(dumps(value, indent=4))
+
+                if key == 'success':
+                    return value
+
+    elif isinstance(response, dict):
+        return response
+
+    raise HueError('Unexpected response content')
+
+
+class HueBridge():
+    """HueBridge."""
+
+    DEFAULT_CONF_PATH = \
+        Path.home() / '.config' / 'pyhue' / 'hue_bridge_config.json'
+
+    # Maximum number of requests sent concurrently to the Hue bridge, by all
+    # the instances communicating with it.
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Default (connect, read) timeouts, in seconds, of the requests sent to the
+    # Hue bridge.
+    DEFAULT_TIMEOUT = (1.0, 3.0)
+
+    # Number of seconds the responses to GET requests without data are cached
+    # for, per API path. The cached responses of a path are invalidated by any
+    # PUT, POST or DELETE request to that path or one below it.
+    CACHE_TTL = {
+        '': 1.0,
+        'config': 5.0,
+        'lights': 1.0,
+    }
+
+    # Cached paths also invalidated by any PUT, POST or DELETE request to an
+    # API, per first component of the API path. For instance a group action
+    # changes the state of the lights of the group.
+    CACHE_INVALIDATES = {
+        'groups': ('lights',),
+    }
+
+    # Number of seconds the lights of each group are cached for. They are
+    # also invalidated by the requests creating, changing or deleting groups
+    # and lights, but not by the requests changing their state.
+    GROUPS_TTL = 60.0
+
+    # HTTP sessions and executors shared by the instances, per Hue bridge host,
+    # as lists of the session, the executor and the number of instances using
+    # them.
+    __sessions = {}
+    __sessions_lock = threading.Lock()
 
     @classmethod
-    def __mkdir_parents_internal(cls, path, full_path):
-        """__mkdir_parents_internal.
+    def __acquire_session(cls, host):
+        """__acquire_session. Get the HTTP session to communicate with a Hue
+        bridge, and the executor to send concurrent requests with. All the
+        instances communicating with the same Hue bridge share the same
+        session, its pooled connections, and the same executor, so the
+        concurrent requests never exceed the size of the pool.
+
+        Each call must be paired with a call to __release_session().
+
+        :param host: Host name / IP address the Hue bridge is accessible at.
+        :type host: str
 
-        Internal method for __mkdir_parents().
+        :return: HTTP session to communicate with the Hue bridge and executor
+                 to send concurrent requests with.
+        :rtype: tuple (requests.Session, concurrent.futures.ThreadPoolExecutor)
+        """
+        with cls.__sessions_lock:
+            entry = cls.__sessions.get(host)
+
+            if entry is None:
+                session = requests.Session()
+                # The Hue bridge is on the local network, do not look up
+                # proxies and netrc credentials from the environment on every
+                # request.
+                session.trust_env = False
+                # Retry the requests failing because the Hue bridge is
+                # momentarily unavailable. urllib3 only retries idempotent
+                # methods by default, so POST requests are never sent twice.
+                # Once the retries are exhausted the last response is returned,
+                # to be reported as a HueError.
+                session.mount(
+                    'http://',
+                    HTTPAdapter(pool_connections=1,
+                                pool_maxsize=cls.MAX_CONCURRENT_REQUESTS,
+                                max_retries=Retry(
+                                    total=2,
+                                    backoff_factor=0.1,
+                                    status_forcelist=(502, 503, 504),
+                                    raise_on_status=False
+                                ))
+                )
+                executor = ThreadPoolExecutor(
+                    max_workers=cls.MAX_CONCURRENT_REQUESTS
+                )
+                entry = cls.__sessions[host] = [session, executor, 0]
+
+            entry[2] += 1
 
-        :param path: Path to the directory to make.
-        :param full_path: Original full path __mkdir_parents() must make.
+            return entry[0], entry[1]
+
+    @classmethod
+    def __release_session(cls, host):
+        """__release_session. Release the HTTP session and the executor
+        obtained from __acquire_session(), they are closed once no instance
+        uses them anymore.
+
+        :param host: Host name / IP address the Hue bridge is accessible at.
+        :type host: str
         """
-        parent = os.path.dirname(path)
+        with cls.__sessions_lock:
+            entry = cls.__sessions[host]
+            entry[2] -= 1
 
-        if not os.path.exists(parent):
-            if parent == path:
-                # Invalid path, let the function mkdir do the proper error
-                # exception.
-                os.mkdir(full_path)
+            if entry[2] != 0:
                 return
-            cls.__mkdir_parents_internal(parent, full_path)
 
-        os.mkdir(path)
+            del cls.__sessions[host]
 
-    @classmethod
-    def __mkdir_parents(cls, path):
-        """__mkdir_parents_internal.
-        Method equivalent to the shell command 'mkdir --parents ${path}'
+        # Wait for the pending requests outside of the lock.
+        entry[1].shutdown()
+        entry[0].close()
 
-        :param path: Path to the directory to make.
+    # pylint: disable=too-many-arguments
+    @classmethod
+    def __send_request(cls, session, request_type, url, data, timeout,
+                       headers=None):
+        """__send_request. Send a request to the Hue bridge without parsing
+        its response.
+
+        The content of the response is not downloaded yet, it must be read
+        with _read_content(), or by streaming response.raw, for the connection
+        to return to the pool.
+
+        :param session: HTTP session to send the request through. Reusing the
+                        same session keeps the connection to the Hue bridge
+                        alive between requests.
+        :type session: requests.Session
+        :param request_type: Type of request to perform (e.i. 'POST', 'PUT',
+                             'DELETE'...).
+        :type request_type: str
+        :param url: URL of the API to access.
+        :type url: str
+        :param data: Data to send.
+        :type data: dict
+        :param timeout: How many seconds to wait for the Hue bridge, as a float
+                        or a (connect, read) tuple.
+        :type timeout: float or tuple (float, float)
+        :param headers: Additional HTTP headers to send, defaults to None.
+        :type headers: dict
+
+        :return: Response from the Hue Bridge.
+        :rtype: requests.Response
         """
-        cls.__mkdir_parents_internal(path, path)
+        data = _encode_request(request_type, url, data)
+
+        response = session.request(request_type, url, data=data,
+                                   headers=headers, timeout=timeout,
+                                   stream=True)
+
+        log.debug('Response status %d', response.status_code)
+
+        return response
 
     # pylint: disable=too-many-arguments
     @classmethod
@@ -216,7 +538,7 @@ class HueBridge():
         :param config_path: Path to where to write the configuration file with
                             the authentication data within, defaults to
                             HueBridge.DEFAULT_CONF_PATH.
-        :type config_path: str
+        :type config_path: str or pathlib.Path
         :param generate_client_key: When set to true, a random 16 byte
                                     clientkey is generated and returned in the
                                     response. This key is encoded as ASCII hex
@@ -239,7 +561,9 @@ class HueBridge():
                 'Device name too long (limited to 19 characters)'
             )
 
-        if os.path.isfile(config_path):
+        config_path = Path(config_path)
+
+        if config_path.is_file():
             confirmation = input(
                 f'A configuration file already exists at {config_path} are '
                 'you sure you want to override it? [N/y]'
@@ -258,17 +582,72 @@ class HueBridge():
         if generate_client_key:
             data['generateclientkey'] = generate_client_key
 
-        config = cls.__do_request('POST', requests.post, host, 'api', data)
+        with requests.Session() as session:
+            response = cls.__send_request(session,
+                                          'POST',
+                                          f'http://{host}/api',
+                                          data,
+                                          cls.DEFAULT_TIMEOUT)
+            config = _parse_response(
+                _read_response(response.ok, _read_content(response))
+            )
 
         config['host'] = host
 
-        try:
-            cls.__mkdir_parents(os.path.dirname(config_path))
-        except FileExistsError:
-            pass
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(dumps(config, indent=4))
+
+    def __do_request(self, request_type, path, data):
+        """__do_request. Send an authenticated request to the Hue bridge.
+
+        :param request_type: Type of request to perform (e.i. 'POST', 'PUT',
+                             'DELETE'...).
+        :type request_type: str
+        :param path: Path of the API to access.
+        :type path: str
+        :param data: Data to send.
+        :type data: dict
 
-        with open(config_path, 'w') as config_file:
-            config_file.write(dumps(config, indent=4))
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        response = self.__send_request(self.__session,
+                                       request_type,
+                                       self.__base_url + path,
+                                       data,
+                                       self.__timeout)
+
+        return _parse_response(
+            _read_response(response.ok, _read_content(response))
+        )
+
+    def __invalidate_cache(self, request_type, path):
+        """__invalidate_cache. Drop the cached responses a request to the
+        given path may have changed.
+
+        :param request_type: Type of request performed (e.i. 'POST', 'PUT',
+                             'DELETE').
+        :type request_type: str
+        :param path: Path of the API accessed.
+        :type path: str
+        """
+        api, *components = path.split('/')
+        related = self.CACHE_INVALIDATES.get(api, ())
+
+        for cached_path in list(self.__cache):
+            if path.startswith(cached_path) or cached_path.startswith(related):
+                self.__cache.pop(cached_path, None)
+
+        # Only the requests to groups or groups/<id>, searching for new lights
+        # or deleting a light change the lights of the groups.
+        if (api == 'groups' and len(components) <= 1) or (
+                api == 'lights' and (
+                    (request_type == 'POST' and not components)
+                    or (request_type == 'DELETE' and len(components) == 1)
+                )):
+            self.__groups = None
 
     def put(self, path, **data):
         """put. Do an authenticated PUT request to the Hue bridge.
@@ -282,11 +661,10 @@ class HueBridge():
         :return: Dictionary containing the response from the Hue Bridge.
         :rtype: dict
         """
-        return self.__do_request('PUT',
-                                 requests.put,
-                                 self.__host,
-                                 f'api/{self.__username}/{path}',
-                                 data)
+        try:
+            return self.__do_request('PUT', path, data)
+        finally:
+            self.__invalidate_cache('PUT', path)
 
     def post(self, path, **data):
         """post. Do an authenticated POST request to the Hue bridge.
@@ -300,15 +678,19 @@ class HueBridge():
         :return: Dictionary containing the response from the Hue Bridge.
         :rtype: dict
         """
-        return self.__do_request('POST',
-                                 requests.post,
-                                 self.__host,
-                                 f'api/{self.__username}/{path}',
-                                 data)
+        try:
+            return self.__do_request('POST', path, data)
+        finally:
+            self.__invalidate_cache('POST', path)
 
     def get(self, path, **data):
         """get. Do an authenticated GET request to the Hue bridge.
 
+        Responses of the paths listed in HueBridge.CACHE_TTL are cached, a new
+        dictionary is decoded from the cached content on each call until it
+        expires. Once expired, it is still reused if the Hue bridge reports,
+        through the ETag or Last-Modified headers, that it did not change.
+
         :param path: Path of the API to access.
         :type path: str
         :param **data: Data to be send along.
@@ -318,11 +700,48 @@ class HueBridge():
         :return: Dictionary containing the response from the Hue Bridge.
         :rtype: dict
         """
-        return self.__do_request('GET',
-                                 requests.get,
-                                 self.__host,
-                                 f'api/{self.__username}/{path}',
-                                 data)
+        ttl = None if data else self.CACHE_TTL.get(path)
+
+        if ttl is None:
+            return self.__do_request('GET', path, data)
+
+        now = time.monotonic()
+        cached = self.__cache.get(path)
+
+        if cached is not None and now < cached[1]:
+            return _parse_response(_loads(cached[0]))
+
+        # Once expired, ask the Hue bridge to only send the response back if
+        # it changed.
+        response = self.__send_request(self.__session,
+                                       'GET',
+                                       self.__base_url + path,
+                                       data,
+                                       self.__timeout,
+                                       headers=cached and cached[2])
+
+        content = _read_content(response)
+
+        if cached is not None and response.status_code == 304:
+            content, _, validators = cached
+            value = _parse_response(_loads(content))
+        else:
+            value = _parse_response(_read_response(response.ok, content))
+
+            validators = {}
+            if (etag := response.headers.get('ETag')) is not None:
+                validators['If-None-Match'] = etag
+            if (modified := response.headers.get('Last-Modified')) is not None:
+                validators['If-Modified-Since'] = modified
+
+            if not validators and not self.__no_validators_logged:
+                self.__no_validators_logged = True
+                log.debug('The Hue bridge sends neither ETag nor '
+                          'Last-Modified, relying on the cache TTL only')
+
+        self.__cache[path] = (content, now + ttl, validators)
+
+        return value
 
     def delete(self, path, **data):
         """delete. Do an authenticated DELETE request to the Hue bridge.
@@ -336,32 +755,153 @@ class HueBridge():
         :return: Dictionary containing the response from the Hue Bridge.
         :rtype: dict
         """
-        return self.__do_request('DELETE',
-                                 requests.delete,
-                                 self.__host,
-                                 f'api/{self.__username}/{path}',
-                                 data)
+        try:
+            return self.__do_request('DELETE', path, data)
+        finally:
+            self.__invalidate_cache('DELETE', path)
 
-    def __init__(self, config_path=DEFAULT_CONF_PATH):
+    def __init__(self, config_path=DEFAULT_CONF_PATH, timeout=DEFAULT_TIMEOUT):
         """__init__. HueBridge class initializer.
 
         :param config_path: Path to the Hue bridge configuration file to load,
                             defaults to HueBridge.DEFAULT_CONF_PATH.
-        :type config_path: str
+        :type config_path: str or pathlib.Path
+        :param timeout: How many seconds to wait for the Hue bridge to answer
+                        each request, as a float or a (connect, read) tuple,
+                        defaults to HueBridge.DEFAULT_TIMEOUT.
+        :type timeout: float or tuple (float, float)
         """
-        with open(config_path) as config_file:
-            config = loads(config_file.read())
+        config_path = Path(config_path)
+        config = _loads(config_path.read_bytes())
 
         self.__host = config['host']
-        self.__username = config['username']
+        self.__base_url = f'http://{self.__host}/api/{config["username"]}/'
+
+        self.__timeout = timeout
+
+        # Cached GET responses associated to their API path, as tuples of the
+        # raw content of the response, the time.monotonic() time they expire
+        # at, and the headers to send to validate them with the Hue bridge once
+        # expired.
+        self.__cache = {}
+        self.__no_validators_logged = False
+
+        # Group ID associated to the set of IDs of the lights of the group, and
+        # the time.monotonic() time they expire at, loaded the first time they
+        # are needed.
+        self.__groups = None
+
+        self.__session, self.__executor = self.__acquire_session(self.__host)
+
+        try:
+            self.lights = self.__load_lights(config, config_path)
+        except Exception:
+            self.close()
+            raise
 
-        lights = self.get_full_state().get('lights')
+        # Light instances, created the first time each of them is requested.
+        self.__light_objects = {}
 
-        if lights is not None:
-            self.lights = {
-                int(key): value.get('name')
-                for key, value in lights.items()
+    def __load_lights(self, config, config_path):
+        """__load_lights. Get the names of the lights connected to the Hue
+        bridge.
+
+        The names are cached in the configuration file along with the ETag of
+        the response they come from, so the Hue bridge only has to send the
+        lights back when they changed.
+
+        :param config: Loaded Hue bridge configuration.
+        :type config: dict
+        :param config_path: Path to the Hue bridge configuration file, updated
+                            when the lights changed, if it is writable.
+        :type config_path: pathlib.Path
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary associating the ID of each light to its name.
+        :rtype: dict
+        """
+        cached_lights = config.get('lights')
+        cached_etag = config.get('lights_etag')
+
+        headers = {}
+        if cached_lights is not None and cached_etag is not None:
+            headers['If-None-Match'] = cached_etag
+
+        response = self.__send_request(self.__session,
+                                       'GET',
+                                       self.__base_url + 'lights',
+                                       {},
+                                       self.__timeout,
+                                       headers=headers)
+
+        content = _read_content(response)
+
+        if response.status_code == 304:
+            log.debug('Lights not modified, using cached names')
+            lights = cached_lights
+        else:
+            lights = {
+                key: value.get('name')
+                for key, value in _parse_response(
+                    _read_response(response.ok, content)
+                ).items()
             }
+            etag = response.headers.get('ETag')
+
+            if lights != cached_lights or etag != cached_etag:
+                config['lights'] = lights
+                config['lights_etag'] = etag
+
+                # The cache is only an optimization, the configuration file
+                # may be read-only.
+                try:
+                    config_path.write_text(dumps(config, indent=4))
+                except OSError as error:
+                    log.debug('Could not cache the lights into %s: %s',
+                              config_path, error)
+
+        return {int(key): name for key, name in lights.items()}
+
+    def __getitem__(self, light_id):
+        """__getitem__. Get a light connected to the Hue bridge.
+
+        :param light_id: ID of the light to get.
+        :type light_id: int
+
+        :raises KeyError: In case there is no light with this ID.
+
+        :return: Light with this ID.
+        :rtype: Light
+        """
+        light = self.__light_objects.get(light_id)
+
+        if light is None:
+            if light_id not in self.lights:
+                raise KeyError(f'Unknown light {light_id}')
+
+            light = self.__light_objects[light_id] = Light(self, light_id)
+
+        return light
+
+    def __contains__(self, light_id):
+        """__contains__. Check whether a light is connected to the Hue bridge.
+
+        :param light_id: ID of the light to check.
+        :type light_id: int
+
+        :return: True if there is a light with this ID, False otherwise.
+        :rtype: bool
+        """
+        return light_id in self.lights
+
+    def __iter__(self):
+        """__iter__. Iterate over the IDs of the lights connected to the Hue
+        bridge.
+
+        :return: Iterator over the IDs of the lights.
+        """
+        return iter(self.lights)
 
     def __str__(self):
         """__str__. Get a human readable string describing this class.
@@ -380,6 +920,32 @@ class HueBridge():
         """
         return f'{self.__class__.__name__}<{self.__host}>'
 
+    def __enter__(self):
+        """__enter__. Use the Hue bridge as a context manager, the HTTP
+        session is closed when leaving the context.
+
+        :return: This Hue bridge.
+        :rtype: HueBridge
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """__exit__. Close the HTTP session when leaving the context.
+
+        :param *exc_info: Exception information, if any.
+        """
+        self.close()
+
+    def close(self):
+        """close. Release the HTTP session used to communicate with the Hue
+        bridge and the threads used to send concurrent requests, they are
+        closed once no other instance uses them.
+        """
+        if self.__session is not None:
+            self.__release_session(self.__host)
+            self.__session = None
+            self.__executor = None
+
     def get_full_state(self):
         """get_full_state. Get a exhaustive current state of the Hue bridge.
 
@@ -390,6 +956,68 @@ class HueBridge():
         """
         return self.get('')
 
+    def get_full_state_subset(self, prefix):
+        """get_full_state_subset. Get only a part of the exhaustive current
+        state of the Hue bridge.
+
+        When ijson is installed the state is parsed incrementally while it is
+        received, only the requested part is built into Python objects.
+
+        :param prefix: Path, in the ijson prefix syntax, of the part of the
+                       state to get. Keys are separated by dots and 'item'
+                       matches every element of a list (e.g. 'lights',
+                       'config.whitelist', 'groups.1.lights.item').
+        :type prefix: str
+
+        :raises HueError: In case of error.
+
+        :return: Iterator over the values found at the prefix.
+        """
+        response = self.__send_request(self.__session,
+                                       'GET',
+                                       self.__base_url,
+                                       {},
+                                       self.__timeout)
+
+        if ijson is None:
+            yield from _iter_prefix(
+                _parse_response(
+                    _read_response(response.ok, _read_content(response))
+                ),
+                prefix.split('.') if prefix else []
+            )
+            return
+
+        # Closing the response drops the connection, in case the iteration is
+        # not completed.
+        with response:
+            if not response.ok:
+                raise HueError('Error sending the request')
+
+            response.raw.decode_content = True
+            # Decode the numbers as float, like _loads() does, rather than as
+            # decimal.Decimal.
+            events = ijson.parse(response.raw, use_float=True)
+
+            # Default values are given to next(), a StopIteration raised within
+            # this generator would be turned into a RuntimeError.
+            first_event = next(events, None)
+
+            if first_event is None:
+                raise HueError('Unexpected response content')
+
+            events = chain((first_event,), events)
+
+            # The state is an object, the errors are reported in an array.
+            if first_event[1] == 'start_array':
+                _parse_response(next(ijson.items(events, ''), None))
+                raise HueError('Unexpected response content')
+
+            yield from ijson.items(events, prefix)
+
+            # The whole content was read, the connection can be reused.
+            response.raw.release_conn()
+
     def get_configuration(self):
         """get_configuration. Get the current configuration from the Hue
         bridge.
@@ -536,26 +1164,531 @@ class HueBridge():
         :raises TypeError: In case a provided keyword argument has invalid
                            type.
         """
-        keyword_arguments = {
-            'on': [bool],
-            'bri': [int, (1, 254)],
-            'bri_inc': [int, (-254, 254)],
-            'hue': [int, (0, 65535)],
-            'hue_inc': [int, (-65534, 65534)],
-            'sat': [int, (0, 65535)],
-            'sat_inc': [int, (-65534, 65534)],
-            'xy': [tuple, ((0, 0), (1.0, 1.0))],
-            'xy_inc': [tuple, ((-0.5, -0.5), (0.5, 0.5))],
-            'ct': [int, (153, 500)],
-            'ct_inc': [int, (-364, 635)],
-            'alert': [LightAlert],
-            'effect': [LightEffect],
-            'transitiontime': [int, (0, 65535)],
+        _check_light_state_kwargs(kwargs)
+
+        self.put(f'lights/{light_id}/state', **kwargs)
+
+    def set_light_states(self, states, timeout=None):
+        """set_light_states. Set the state of several lights with a
+        different state for each of them. The requests are sent concurrently
+        to the Hue bridge.
+
+        To set the same state to several lights prefer set_group_state() which
+        needs a single request.
+
+        :param states: Dictionary associating the ID of each light to change
+                       to the state to set, as a dictionary of keyword
+                       arguments accepted by set_light_state().
+        :type states: dict
+        :param timeout: Maximum number of seconds to wait for all the requests
+                        to complete, if None, wait without limit, defaults to
+                        None.
+        :type timeout: float
+
+        :raises HueError: In case of error, or if the requests did not complete
+                          within the timeout.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        for state in states.values():
+            _check_light_state_kwargs(state)
+
+        futures = [
+            self.__executor.submit(self.put,
+                                   f'lights/{light_id}/state',
+                                   **state)
+            for light_id, state in states.items()
+        ]
+
+        done, not_done = wait(futures, timeout=timeout)
+
+        if not_done:
+            raise HueError('Timeout setting the state of the lights')
+
+        for future in done:
+            future.result()
+
+    #
+    # Groups API
+    #
+
+    def set_group_state(self, group_id=0, **kwargs):
+        """set_group_state. Set the state of all the lights of a group at once
+        with a single request, the Hue bridge forwards the command to each
+        light of the group.
+
+        :param group_id: ID of the group which state to change. Group 0 is the
+                         special group containing all the lights known by the
+                         Hue bridge, defaults to 0.
+        :param **kwargs: State to set, accepts the same keyword arguments as
+                         set_light_state().
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        _check_light_state_kwargs(kwargs)
+
+        self.put(f'groups/{group_id}/action', **kwargs)
+
+    def __find_group(self, light_ids):
+        """__find_group. Find a group containing exactly the given lights.
+
+        The lights of the groups, including the special group 0 containing all
+        the lights, are cached for HueBridge.GROUPS_TTL seconds, or until a
+        request changes them.
+
+        :param light_ids: IDs of the lights the group must contain.
+        :type light_ids: frozenset
+
+        :raises HueError: In case of error.
+
+        :return: ID of the group found, None if there is none.
+        :rtype: int
+        """
+        now = time.monotonic()
+
+        if self.__groups is None or self.__groups[1] <= now:
+            groups = {
+                frozenset(int(light_id) for light_id in group['lights']):
+                int(group_id)
+                for group_id, group in self.__do_request('GET',
+                                                         'groups',
+                                                         {}).items()
+            }
+
+            # Prefer group 0 to a group containing all the lights.
+            all_lights = self.__do_request('GET', 'groups/0', {})['lights']
+            groups[frozenset(int(light_id) for light_id in all_lights)] = 0
+
+            self.__groups = (groups, now + self.GROUPS_TTL)
+
+        return self.__groups[0].get(light_ids)
+
+    def set_lights_state(self, light_ids, **kwargs):
+        """set_lights_state. Set the same state to several lights.
+
+        If a group contains exactly these lights a single request is sent to
+        that group, otherwise one request per light is sent concurrently.
+
+        :param light_ids: IDs of the lights which state to change.
+        :type light_ids: iterable
+        :param **kwargs: State to set, accepts the same keyword arguments as
+                         set_light_state().
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        # Check the state before looking for a group, which may need requests.
+        _check_light_state_kwargs(kwargs)
+
+        light_ids = frozenset(light_ids)
+
+        group_id = self.__find_group(light_ids)
+
+        if group_id is not None:
+            self.set_group_state(group_id, **kwargs)
+        else:
+            self.set_light_states({light_id: kwargs for light_id in light_ids})
+
+
+class Light():
+    """Light. Light connected to a Hue bridge, get it with
+    hue_bridge[light_id].
+
+    The path of the light API is built once, so it is cheaper to control the
+    same light repeatedly through its Light instance.
+    """
+
+    def __init__(self, bridge, light_id):
+        """__init__. Light class initializer.
+
+        :param bridge: Hue bridge the light is connected to.
+        :type bridge: HueBridge
+        :param light_id: ID of the light.
+        :type light_id: int
+        """
+        self.bridge = bridge
+        self.light_id = light_id
+        self.__state_path = f'lights/{light_id}/state'
+
+    def __repr__(self):
+        """__repr__. Get a string representation of this class.
+        :return: String representation of this class.
+        :rtype: str
+        """
+        return f'{self.__class__.__name__}<{self.light_id}: {self.name}>'
+
+    @property
+    def name(self):
+        """name. Name of the light, as known when the Hue bridge was loaded.
+
+        :rtype: str
+        """
+        return self.bridge.lights.get(self.light_id)
+
+    def get_info(self):
+        """get_info. Get information about the light, including its state.
+
+        :raises HueError: In case of error.
+
+        :return: JSON as dict describing the light.
+        :rtype: dict
+        """
+        return self.bridge.get_light(self.light_id)
+
+    def set_state(self, **kwargs):
+        """set_state. Set the state of the light.
+
+        :param **kwargs: State to set, accepts the same keyword arguments as
+                         HueBridge.set_light_state().
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        _check_light_state_kwargs(kwargs)
+
+        self.bridge.put(self.__state_path, **kwargs)
+
+
+class AsyncHueBridge():
+    """AsyncHueBridge. Asynchronous counterpart of HueBridge, requires
+    aiohttp.
+
+    It provides the requests, configuration, lights and group state methods of
+    HueBridge, without caching the responses. get_full_state_subset(),
+    set_lights_state() and the Light objects are not provided.
+
+    The requests are sent through a single aiohttp session, so several of them
+    can be in flight at the same time. The bridge must be opened before use,
+    preferably as an asynchronous context manager:
+
+        async with AsyncHueBridge() as hue_bridge:
+            await hue_bridge.set_light_state(1, on=True)
+    """
+
+    # Maximum number of connections opened at the same time to the Hue
+    # bridge.
+    MAX_CONCURRENT_REQUESTS = 10
+
+    def __init__(self,
+                 config_path=HueBridge.DEFAULT_CONF_PATH,
+                 timeout=HueBridge.DEFAULT_TIMEOUT):
+        """__init__. AsyncHueBridge class initializer.
+
+        :param config_path: Path to the Hue bridge configuration file to load,
+                            defaults to HueBridge.DEFAULT_CONF_PATH.
+        :type config_path: str or pathlib.Path
+        :param timeout: How many seconds to wait for the Hue bridge to answer
+                        each request, as a float or a (connect, read) tuple,
+                        defaults to HueBridge.DEFAULT_TIMEOUT.
+        :type timeout: float or tuple (float, float)
+
+        :raises ImportError: In case aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncHueBridge requires aiohttp')
+
+        config = _loads(Path(config_path).read_bytes())
+
+        self.__host = config['host']
+        self.__base_url = f'http://{self.__host}/api/{config["username"]}/'
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout = read_timeout = timeout
+
+        self.__timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout,
+                                               sock_read=read_timeout)
+        self.__session = None
+
+        # Light names cached in the configuration file, refreshed by open().
+        self.lights = {
+            int(key): name for key, name in config.get('lights', {}).items()
         }
 
-        for key in kwargs:
-            if key not in keyword_arguments:
-                raise KeyError(f'Unknown {key} keyword argument')
-            self.__check_kwarg(kwargs, key, *keyword_arguments[key])
+    def __repr__(self):
+        """__repr__. Get a string representation of this class.
+        :return: String representation of this class.
+        :rtype: str
+        """
+        return f'{self.__class__.__name__}<{self.__host}>'
 
-        self.put(f'lights/{light_id}/state', **kwargs)
+    async def __aenter__(self):
+        """__aenter__. Open the Hue bridge when entering the context.
+
+        :return: This Hue bridge.
+        :rtype: AsyncHueBridge
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """__aexit__. Close the HTTP session when leaving the context.
+
+        :param *exc_info: Exception information, if any.
+        """
+        await self.close()
+
+    async def open(self):
+        """open. Open the HTTP session used to communicate with the Hue bridge
+        and get the names of its lights. The session previously opened, if
+        any, is closed.
+
+        :raises HueError: In case of error.
+        """
+        await self.close()
+
+        self.__session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.MAX_CONCURRENT_REQUESTS
+            ),
+            timeout=self.__timeout
+        )
+
+        try:
+            lights = await self.get('lights')
+        except Exception:
+            await self.close()
+            raise
+
+        self.lights = {
+            int(key): value.get('name') for key, value in lights.items()
+        }
+
+    async def close(self):
+        """close. Close the HTTP session used to communicate with the Hue
+        bridge.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def __do_request(self, request_type, path, data):
+        """__do_request. Send an authenticated request to the Hue bridge.
+
+        :param request_type: Type of request to perform (e.i. 'POST', 'PUT',
+                             'DELETE'...).
+        :type request_type: str
+        :param path: Path of the API to access.
+        :type path: str
+        :param data: Data to send.
+        :type data: dict
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        url = self.__base_url + path
+        data = _encode_request(request_type, url, data)
+
+        async with self.__session.request(request_type,
+                                          url,
+                                          data=data) as response:
+            log.debug('Response status %d', response.status)
+            body = _read_response(response.ok, await response.read())
+
+        return _parse_response(body)
+
+    async def put(self, path, **data):
+        """put. Do an authenticated PUT request to the Hue bridge.
+
+        :param path: Path of the API to access.
+        :type path: str
+        :param **data: Data to be send along.
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        return await self.__do_request('PUT', path, data)
+
+    async def post(self, path, **data):
+        """post. Do an authenticated POST request to the Hue bridge.
+
+        :param path: Path of the API to access.
+        :type path: str
+        :param **data: Data to be send along.
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        return await self.__do_request('POST', path, data)
+
+    async def get(self, path, **data):
+        """get. Do an authenticated GET request to the Hue bridge.
+
+        :param path: Path of the API to access.
+        :type path: str
+        :param **data: Data to be send along.
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        return await self.__do_request('GET', path, data)
+
+    async def delete(self, path, **data):
+        """delete. Do an authenticated DELETE request to the Hue bridge.
+
+        :param path: Path of the API to access.
+        :type path: str
+        :param **data: Data to be send along.
+
+        :raises HueError: In case of error.
+
+        :return: Dictionary containing the response from the Hue Bridge.
+        :rtype: dict
+        """
+        return await self.__do_request('DELETE', path, data)
+
+    async def get_full_state(self):
+        """get_full_state. Get a exhaustive current state of the Hue bridge.
+
+        :raises HueError: In case of error.
+
+        :return: JSON as dict describing the full state of the Hue bridge.
+        :rtype: dict
+        """
+        return await self.get('')
+
+    async def get_configuration(self):
+        """get_configuration. Get the current configuration from the Hue
+        bridge.
+
+        :raises HueError: In case of error.
+
+        :return: JSON as dict describing the current configuration of the Hue
+                 bridge.
+        :rtype: dict
+        """
+        return await self.get('config')
+
+    async def set_configuration(self, **config):
+        """set_configuration. Set the Hue bridge configuration.
+
+        :param config: Configuration to set in the Hue bridge.
+
+        :raises HueError: In case of error.
+        """
+        await self.put('config', **config)
+
+    async def get_light(self, light_id=None):
+        """get_light. Get light information.
+
+        :param light_id: Light identifier you specifically wants the state of,
+                         if None then the state of all the lights will be
+                         returned, defaults to None.
+
+        :raises HueError: In case of error.
+
+        :return: JSON as dict describing the state of the lights.
+        :rtype: dict
+        """
+        return await self.get(
+            'lights{}'.format(f'/{light_id}' if light_id else '')
+        )
+
+    async def get_new_lights(self):
+        """get_new_lights. Gets a list of lights that were discovered the last
+        time a search for new lights was performed.
+
+        :raises HueError: In case of error.
+
+        :return: JSON as dict listing the new lights.
+        :rtype: dict
+        """
+        return await self.get('lights/new')
+
+    async def rename_light(self, light_id, name):
+        """rename_light.
+
+        :param light_id: ID of the light to rename.
+        :param name: New name for that light.
+
+        :raises HueError: In case of error.
+        """
+        await self.put(f'lights/{light_id}', name=name)
+
+    async def set_light_state(self, light_id, **kwargs):
+        """set_light_state. See HueBridge.set_light_state().
+
+        :param light_id: ID of the light which state to change.
+        :param **kwargs: State to set, accepts the same keyword arguments as
+                         HueBridge.set_light_state().
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        _check_light_state_kwargs(kwargs)
+
+        await self.put(f'lights/{light_id}/state', **kwargs)
+
+    async def set_light_states(self, states):
+        """set_light_states. Set the state of several lights with a
+        different state for each of them. All the requests are sent
+        concurrently to the Hue bridge.
+
+        :param states: Dictionary associating the ID of each light to change
+                       to the state to set, as a dictionary of keyword
+                       arguments accepted by HueBridge.set_light_state().
+        :type states: dict
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        for state in states.values():
+            _check_light_state_kwargs(state)
+
+        await asyncio.gather(*(
+            self.put(f'lights/{light_id}/state', **state)
+            for light_id, state in states.items()
+        ))
+
+    async def set_group_state(self, group_id=0, **kwargs):
+        """set_group_state. See HueBridge.set_group_state().
+
+        :param group_id: ID of the group which state to change. Group 0 is the
+                         special group containing all the lights known by the
+                         Hue bridge, defaults to 0.
+        :param **kwargs: State to set, accepts the same keyword arguments as
+                         HueBridge.set_light_state().
+
+        :raises HueError: In case of error.
+        :raises KeyError: In case a provided keyword argument has invalid key.
+        :raises ValueError: In case a provided keyword argument has invalid
+                            value.
+        :raises TypeError: In case a provided keyword argument has invalid
+                           type.
+        """
+        _check_light_state_kwargs(kwargs)
+
+        await self.put(f'groups/{group_id}/action', **kwargs)
@@ -24,7 +24,13 @@ scripts = [
     os.path.join('bin', 'hue_bridge'),
 ]
 
-install_requires = ['requests>=2.23.0', 'zeroconf>=0.28.8']
+install_requires = ['requests>=2.23.0', 'zeroconf>=0.36.0']
+
+extras_require = {
+    'orjson': ['orjson>=3.3.0'],
+    'ijson': ['ijson>=3.1.0'],
+    'aiohttp': ['aiohttp>=3.7.0'],
+}
 
 setup(
     name='pyhue',
@@ -35,5 +41,6 @@ setup(
     include_package_data=True,
     scripts=scripts,
     install_requires=install_requires,
+    extras_require=extras_require,
     python_requires=">=3.8"
 )